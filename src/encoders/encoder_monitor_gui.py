@@ -7,6 +7,10 @@
 
 import sys
 import time
+import ctypes
+import struct
+import threading
+from collections import deque
 from datetime import datetime
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget,
@@ -16,73 +20,190 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import QTimer, QThread, pyqtSignal, Qt
 from PyQt6.QtGui import QFont, QPalette, QColor, QPixmap
 import snap7
-from snap7.util import get_real
+try:
+    from snap7.types import Areas as Area, WordLen, S7DataItem
+except ImportError:  # python-snap7 >= 2.0
+    from snap7.type import Area, WordLen, S7DataItem
 import pyqtgraph as pg
 import numpy as np
 
+# 单次 read_multi_vars 请求的最大变量数（S7 协议限制）
+MAX_VARS_PER_REQUEST = 20
+
+# REAL (大端 IEEE-754 单精度) 解包函数，模块加载时编译一次
+_REAL_UNPACK = struct.Struct('>f').unpack_from
+
+# TCP 断线后的重连间隔(毫秒)
+RECONNECT_INTERVAL_MS = 500
+
+# 连接状态检查/上报节流
+CONNECTION_CHECK_EVERY = 20     # 每读取 N 次检查一次 get_connected
+STATUS_EMIT_INTERVAL = 2.0      # 状态不变时的最小上报间隔(秒)
+
 
 class EncoderDataReader(QThread):
     """编码器数据读取线程"""
 
-    data_received = pyqtSignal(float, datetime)  # 位置值和时间戳
+    data_received = pyqtSignal(float, float)      # 位置值和时间戳(time.monotonic 秒)
     connection_status = pyqtSignal(bool, str)     # 连接状态和错误信息
 
-    def __init__(self, plc_ip="192.168.0.1", rack=0, slot=1, db_number=5, offset=124):
+    def __init__(self, plc_ip="192.168.0.1", rack=0, slot=1, db_number=5, offset=124, tags=None):
+        """
+        Args:
+            tags: 额外读取的变量列表 [(db, offset, size), ...]，
+                  第一个变量始终为编码器位置 (db_number, offset, 4)
+        """
         super().__init__()
         self.plc_ip = plc_ip
         self.rack = rack
         self.slot = slot
         self.db_number = db_number
         self.offset = offset
+        self.tags = [(db_number, offset, 4)] + list(tags or [])
         self.is_running = False
         self.client = None
+        self.poll_interval_ms = 100          # 读取间隔(毫秒)，可在运行中修改
+        self._wakeup = threading.Event()     # 用于提前结束等待（修改间隔或停止时）
+        self._connected = False
+        self._reads_since_check = 0
+        self._last_status = None
+        self._last_status_emit = 0.0
 
     def run(self):
         """线程运行主循环"""
         self.is_running = True
 
+        # 整个线程生命周期只使用一个客户端，断线后在原客户端上重连
+        if self.client is None:
+            self.client = snap7.client.Client()
+
         while self.is_running:
             try:
-                # 创建客户端连接
-                if self.client is None:
-                    self.client = snap7.client.Client()
+                # 定期确认连接状态，而不是每次读取都检查
+                if self._connected and self._reads_since_check >= CONNECTION_CHECK_EVERY:
+                    self._reads_since_check = 0
+                    self._connected = self.client.get_connected()
+
+                # 建立连接
+                if not self._connected:
                     self.client.connect(self.plc_ip, self.rack, self.slot)
+                    self._connected = self.client.get_connected()
 
-                    if self.client.get_connected():
-                        self.connection_status.emit(True, "PLC 连接成功")
+                    if self._connected:
+                        self._emit_status(True, "PLC 连接成功")
                     else:
-                        self.connection_status.emit(False, "PLC 连接失败")
-                        time.sleep(1)
+                        self._emit_status(False, "PLC 连接失败")
+                        self._wakeup.wait(RECONNECT_INTERVAL_MS / 1000)
+                        self._wakeup.clear()
                         continue
 
-                # 读取编码器位置
-                data = self.client.db_read(self.db_number, self.offset, 4)
-                position = get_real(data, 0)
-                current_time = datetime.now()
+                # 读取编码器位置（多个变量时合并为一次请求）
+                data = self.read_tags()[0]
+                (position,) = _REAL_UNPACK(data)
+                current_time = time.monotonic()
 
                 # 发送数据
                 self.data_received.emit(position, current_time)
-                self.connection_status.emit(True, "数据读取正常")
+                self._reads_since_check += 1
+                self._emit_status(True, "数据读取正常")
 
             except Exception as e:
-                self.connection_status.emit(False, f"读取错误: {str(e)}")
+                self._emit_status(False, f"读取错误: {str(e)}")
 
-                # 尝试重新连接
-                try:
-                    if self.client:
+                # 只有 TCP 连接真正断开时才断开重连；
+                # 其他错误（如 Job Pending）在下一个周期直接重试
+                if self._is_tcp_error(e):
+                    self._connected = False
+                    try:
                         self.client.disconnect()
-                    self.client = None
-                except:
-                    pass
-
-                time.sleep(2)
+                    except Exception:
+                        pass
+                    self._wakeup.wait(RECONNECT_INTERVAL_MS / 1000)
+                    self._wakeup.clear()
+                    continue
 
             # 控制读取频率
-            self.msleep(100)  # 100ms 读取间隔
+            self._wakeup.wait(self.poll_interval_ms / 1000)
+            self._wakeup.clear()
+
+    def set_poll_interval(self, interval_ms):
+        """修改读取间隔，立即生效"""
+        self.poll_interval_ms = interval_ms
+        self._wakeup.set()
+
+    def _emit_status(self, connected, message):
+        """上报连接状态；正常状态不变时按 STATUS_EMIT_INTERVAL 节流"""
+        now = time.monotonic()
+        if (not connected or connected != self._last_status
+                or now - self._last_status_emit >= STATUS_EMIT_INTERVAL):
+            self.connection_status.emit(connected, message)
+            self._last_status = connected
+            self._last_status_emit = now
+
+    def _is_tcp_error(self, error):
+        """判断异常是否为 TCP 层错误（需要断开重连）"""
+        # snap7 的 TCP 错误位于错误码低 16 位，对应的错误文本以 "TCP" 开头
+        if "TCP" in str(error):
+            return True
+        try:
+            return not self.client.get_connected()
+        except Exception:
+            return True
+
+    def read_tags(self):
+        """读取所有变量，返回各变量的原始字节数据列表
+
+        snap7 通过 ctypes.CDLL 调用 C 库，ctypes 在外部函数调用期间会释放 GIL，
+        因此阻塞的网络读取不会卡住 GUI 线程，无需额外的线程池包装。
+        """
+        if len(self.tags) == 1:
+            db, offset, size = self.tags[0]
+            return [self.client.db_read(db, offset, size)]
+
+        # 同一 DB 块内的变量：一次 db_read 覆盖整个地址范围
+        dbs = {db for db, _, _ in self.tags}
+        if len(dbs) == 1:
+            db = dbs.pop()
+            start = min(offset for _, offset, _ in self.tags)
+            end = max(offset + size for _, offset, size in self.tags)
+            if end - start <= 4 * sum(size for _, _, size in self.tags):
+                raw = self.client.db_read(db, start, end - start)
+                return [raw[offset - start:offset - start + size] for _, offset, size in self.tags]
+
+        # 分散的变量：使用 read_multi_vars 合并为一个 PDU
+        results = []
+        for i in range(0, len(self.tags), MAX_VARS_PER_REQUEST):
+            results.extend(self._read_multi_vars(self.tags[i:i + MAX_VARS_PER_REQUEST]))
+        return results
+
+    def _read_multi_vars(self, tags):
+        """通过 read_multi_vars 一次读取多个变量"""
+        items = (S7DataItem * len(tags))()
+        buffers = []
+        for item, (db, offset, size) in zip(items, tags):
+            buffer = ctypes.create_string_buffer(size)
+            item.Area = ctypes.c_int32(Area.DB.value)
+            item.WordLen = ctypes.c_int32(WordLen.Byte.value)
+            item.Result = ctypes.c_int32(0)
+            item.DBNumber = ctypes.c_int32(db)
+            item.Start = ctypes.c_int32(offset)
+            item.Amount = ctypes.c_int32(size)
+            item.pData = ctypes.cast(ctypes.pointer(buffer), ctypes.POINTER(ctypes.c_uint8))
+            buffers.append(buffer)
+
+        self.client.read_multi_vars(items)
+
+        results = []
+        for item, buffer in zip(items, buffers):
+            if item.Result != 0:
+                raise RuntimeError(f"读取 DB{item.DBNumber}.DBB{item.Start} 失败, 错误码: {item.Result}")
+            results.append(bytearray(buffer.raw))
+        return results
 
     def stop(self):
         """停止线程"""
         self.is_running = False
+        self._wakeup.set()
         try:
             if self.client:
                 self.client.disconnect()
@@ -94,13 +215,63 @@ class EncoderDataReader(QThread):
 class EncoderMonitorGUI(QMainWindow):
     """编码器监控主窗口"""
 
+    # 开始/停止按钮样式（只构造一次，切换时直接复用）
+    _START_BUTTON_STYLE = """
+        QPushButton {
+            background-color: #5E81AC;
+            color: white;
+            font-size: 16px;
+            font-weight: bold;
+            padding: 10px;
+            border-radius: 5px;
+        }
+        QPushButton:hover {
+            background-color: #81A1C1;
+        }
+    """
+    _STOP_BUTTON_STYLE = """
+        QPushButton {
+            background-color: #BF616A;
+            color: white;
+            font-size: 16px;
+            font-weight: bold;
+            padding: 10px;
+            border-radius: 5px;
+        }
+        QPushButton:hover {
+            background-color: #D08770;
+        }
+    """
+
     def __init__(self):
         super().__init__()
         self.data_reader = None
-        self.position_history = []  # 位置历史数据
-        self.time_history = []      # 时间历史数据
         self.max_history_points = 1000  # 最大历史数据点数
 
+        # 历史数据环形缓冲区（预分配，避免 list.pop(0) 的 O(n) 移动）
+        # 位置用 float32 存储：24 位尾数足够 mm 级精度，内存减半；时间戳需保留 float64
+        self._buf = np.empty(self.max_history_points, dtype=np.float32)   # 位置
+        self._tbuf = np.empty(self.max_history_points, dtype=np.float64)  # 时间戳(monotonic 秒)
+        self._head = 0   # 下一个写入位置
+        self._count = 0  # 有效数据点数
+
+        # 滑动窗口统计：累计和 + 单调队列维护最大/最小值，每个数据点 O(1)
+        self._seq = 0                # 已接收数据点序号
+        self._sum = 0.0
+        self._max_dq = deque()       # (序号, 值)，值单调递减
+        self._min_dq = deque()       # (序号, 值)，值单调递增
+
+        # 曲线坐标轴状态缓存，避免每次刷新都重设范围
+        self._y_range = None
+        self._x_scrolling = False
+
+        # 显示抽样：每 N 个数据点刷新一次位置显示，与读取频率解耦
+        self.display_decimation = 1
+        self._samples_since_display = 0
+        self._plot_dirty = False  # 上次绘图后是否有新数据
+        self._last_lcd = None     # 上次显示的位置值（按显示精度取整）
+        self._change_count = 0    # 位置变化次数
+
         self.init_ui()
 
     def init_ui(self):
@@ -154,6 +325,17 @@ class EncoderMonitorGUI(QMainWindow):
         self.stats_timer.timeout.connect(self.update_statistics)
         self.stats_timer.start(1000)  # 每秒更新统计信息
 
+        # 日志先进入有界队列，由定时器批量写入，避免高频 append 反复重排文档
+        self._log_queue = deque(maxlen=500)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self._log_flush_timer.start(250)
+
+        # 变化指示器复位定时器（单个定时器重复使用，重新 start 即顺延）
+        self._indicator_reset_timer = QTimer(self)
+        self._indicator_reset_timer.setSingleShot(True)
+        self._indicator_reset_timer.timeout.connect(self._reset_change_indicator)
+
         # 记录开始时间
         self.start_time = datetime.now()
 
@@ -292,6 +474,20 @@ class EncoderMonitorGUI(QMainWindow):
 
         layout.addLayout(threshold_layout)
 
+        # 显示抽样设置
+        decimation_layout = QHBoxLayout()
+        decimation_layout.addWidget(QLabel("显示抽样:"))
+
+        self.decimation_spinbox = QSpinBox()
+        self.decimation_spinbox.setRange(1, 100)
+        self.decimation_spinbox.setValue(self.display_decimation)
+        self.decimation_spinbox.setPrefix("每 ")
+        self.decimation_spinbox.setSuffix(" 个点")
+        self.decimation_spinbox.valueChanged.connect(self.update_decimation)
+        decimation_layout.addWidget(self.decimation_spinbox)
+
+        layout.addLayout(decimation_layout)
+
         # 添加垂直拉伸
         layout.addStretch()
         return group
@@ -349,6 +545,7 @@ class EncoderMonitorGUI(QMainWindow):
         self.log_text = QTextEdit()
         self.log_text.setMaximumHeight(150)
         self.log_text.setReadOnly(True)
+        self.log_text.document().setMaximumBlockCount(1000)  # 滚动日志，最多保留 1000 行
         self.log_text.setStyleSheet("""
             QTextEdit {
                 background-color: #3B4252;
@@ -372,30 +569,19 @@ class EncoderMonitorGUI(QMainWindow):
         """开始监控"""
         try:
             self.data_reader = EncoderDataReader()
+            self.data_reader.poll_interval_ms = self.freq_slider.value()
             self.data_reader.data_received.connect(self.on_data_received)
             self.data_reader.connection_status.connect(self.on_connection_status)
             self.data_reader.start()
 
             self.start_btn.setText("停止监控")
-            self.start_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #BF616A;
-                    color: white;
-                    font-size: 16px;
-                    font-weight: bold;
-                    padding: 10px;
-                    border-radius: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #D08770;
-                }
-            """)
+            self.start_btn.setStyleSheet(self._STOP_BUTTON_STYLE)
 
             self.start_time = datetime.now()
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] 开始监控右缸编码器位置...")
+            self.log_message("开始监控右缸编码器位置...")
 
         except Exception as e:
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] 启动监控失败: {e}")
+            self.log_message("启动监控失败: %s", e)
 
     def stop_monitoring(self):
         """停止监控"""
@@ -404,53 +590,104 @@ class EncoderMonitorGUI(QMainWindow):
             self.data_reader = None
 
         self.start_btn.setText("开始监控")
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #5E81AC;
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 10px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #81A1C1;
-            }
-        """)
+        self.start_btn.setStyleSheet(self._START_BUTTON_STYLE)
 
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] 监控已停止")
+        self.log_message("监控已停止")
 
     def on_data_received(self, position, timestamp):
         """接收到数据时的处理"""
-        # 更新位置显示
-        self.position_lcd.display(position)
-
-        # 添加到历史数据
-        self.position_history.append(position)
-        self.time_history.append(timestamp)
-
-        # 限制历史数据长度
-        if len(self.position_history) > self.max_history_points:
-            self.position_history.pop(0)
-            self.time_history.pop(0)
-
-        # 更新当前位置标签
-        self.current_pos_label.setText(f"{position:.3f} mm")
+        # 上一个数据点
+        prev_pos = self._buf[self._head - 1] if self._count else None
+
+        # 更新滑动窗口统计
+        self._update_running_stats(position)
+
+        # 写入环形缓冲区
+        self._buf[self._head] = position
+        self._tbuf[self._head] = timestamp
+        self._head = (self._head + 1) % self.max_history_points
+        self._count = min(self._count + 1, self.max_history_points)
+        self._plot_dirty = True
+
+        # 按抽样间隔更新位置显示
+        self._samples_since_display += 1
+        if self._samples_since_display >= self.display_decimation:
+            self._samples_since_display = 0
+
+            # 显示精度内没有变化时不重绘
+            rounded = round(position, 3)
+            if rounded != self._last_lcd:
+                self._last_lcd = rounded
+                self.position_lcd.display(rounded)
+                self.current_pos_label.setText(f"{rounded:.3f} mm")
 
         # 检测位置变化
-        if len(self.position_history) >= 2:
-            prev_pos = self.position_history[-2]
+        if prev_pos is not None:
             threshold = self.threshold_spinbox.value()
 
             if abs(position - prev_pos) >= threshold:
                 self.change_indicator.setStyleSheet("color: #A3BE8C; font-size: 24px;")
-                self.change_count_label.setText(f"{int(self.change_count_label.text().split()[0]) + 1} 次")
+                self._change_count += 1
+                self.change_count_label.setText(f"{self._change_count} 次")
 
                 # 记录变化到日志
-                self.log_text.append(f"[{timestamp.strftime('%H:%M:%S')}] 位置变化: {prev_pos:.3f} → {position:.3f} mm")
+                self.log_message("位置变化: %.3f → %.3f mm", prev_pos, position)
 
                 # 2秒后恢复指示器颜色
-                QTimer.singleShot(2000, lambda: self.change_indicator.setStyleSheet("color: gray; font-size: 24px;"))
+                self._indicator_reset_timer.start(2000)
+
+    def _reset_change_indicator(self):
+        """恢复变化指示器颜色"""
+        self.change_indicator.setStyleSheet("color: gray; font-size: 24px;")
+
+    def _update_running_stats(self, position):
+        """将新数据点加入滑动窗口统计（须在写入环形缓冲区之前调用）"""
+        # 按缓冲区存储精度取值，保证移出时减去的值与加入时一致
+        position = float(self._buf.dtype.type(position))
+
+        # 缓冲区已满时，即将被覆盖的最旧数据移出累计和
+        if self._count == self.max_history_points:
+            self._sum -= float(self._buf[self._head])
+        self._sum += position
+
+        seq = self._seq
+        self._seq += 1
+
+        # 单调队列：移除不可能再成为最大/最小值的数据
+        while self._max_dq and self._max_dq[-1][1] <= position:
+            self._max_dq.pop()
+        self._max_dq.append((seq, position))
+        while self._min_dq and self._min_dq[-1][1] >= position:
+            self._min_dq.pop()
+        self._min_dq.append((seq, position))
+
+        # 移除已滑出窗口的数据
+        oldest = seq - self.max_history_points
+        if self._max_dq[0][0] <= oldest:
+            self._max_dq.popleft()
+        if self._min_dq[0][0] <= oldest:
+            self._min_dq.popleft()
+
+    def log_message(self, message, *args):
+        """添加一条日志；格式化推迟到 _flush_log 批量写入时进行（args 按 % 格式填入）"""
+        self._log_queue.append((time.time(), message, args))
+
+    def _flush_log(self):
+        """将队列中的日志一次性格式化并写入日志面板"""
+        if not self._log_queue:
+            return
+
+        lines = []
+        last_second = None
+        for ts, message, args in self._log_queue:
+            # 同一秒内的日志共用一次 strftime
+            second = int(ts)
+            if second != last_second:
+                last_second = second
+                time_str = time.strftime('%H:%M:%S', time.localtime(second))
+            lines.append(f"[{time_str}] {message % args if args else message}")
+        self._log_queue.clear()
+        self.log_text.append("\n".join(lines))
 
     def on_connection_status(self, connected, message):
         """连接状态更新"""
@@ -463,14 +700,13 @@ class EncoderMonitorGUI(QMainWindow):
 
     def update_statistics(self):
         """更新统计信息"""
-        if not self.position_history:
+        if not self._count:
             return
 
-        # 计算统计值
-        positions = np.array(self.position_history)
-        max_pos = np.max(positions)
-        min_pos = np.min(positions)
-        avg_pos = np.mean(positions)
+        # 读取滑动窗口统计值
+        max_pos = self._max_dq[0][1]
+        min_pos = self._min_dq[0][1]
+        avg_pos = self._sum / self._count
 
         # 更新标签
         self.max_pos_label.setText(f"{max_pos:.3f} mm")
@@ -484,47 +720,82 @@ class EncoderMonitorGUI(QMainWindow):
             minutes, seconds = divmod(remainder, 60)
             self.runtime_label.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
 
-        # 更新图表
-        self.update_chart()
+        # 更新图表（没有新数据时跳过）
+        if self._plot_dirty:
+            self.update_chart()
 
     def update_chart(self):
         """更新实时曲线图"""
-        if len(self.time_history) < 2:
+        if self._count < 2:
             return
 
+        self._plot_dirty = False
+
+        # 按时间顺序取出历史数据
+        times, positions = self.get_history()
+
         # 计算时间轴（相对时间，秒）
-        start_time = self.time_history[0]
-        time_seconds = [(t - start_time).total_seconds() for t in self.time_history]
+        time_seconds = times - times[0]
 
-        # 更新曲线数据
-        self.plot_curve.setData(time_seconds, self.position_history)
+        # 更新曲线数据（直接传入 ndarray，pyqtgraph 无需再做类型转换）
+        self.plot_curve.setData(time_seconds, positions)
 
-        # 自动调整 X 轴范围
+        # 自动调整 X 轴范围（未满 60 秒时范围固定，只需设置一次）
         if time_seconds[-1] > 60:
             self.plot_widget.setXRange(time_seconds[-1] - 60, time_seconds[-1])
-        else:
+            self._x_scrolling = True
+        elif self._x_scrolling:
             self.plot_widget.setXRange(0, 60)
-
-        # 自动调整 Y 轴范围
-        if self.position_history:
-            min_val = min(self.position_history)
-            max_val = max(self.position_history)
-            margin = (max_val - min_val) * 0.1 + 1
-            self.plot_widget.setYRange(min_val - margin, max_val + margin)
+            self._x_scrolling = False
+
+        # 自动调整 Y 轴范围（变化超过 5% 才重新设置）
+        min_val = self._min_dq[0][1]
+        max_val = self._max_dq[0][1]
+        if self._y_range is not None:
+            last_min, last_max = self._y_range
+            tolerance = (last_max - last_min) * 0.05
+            if abs(min_val - last_min) <= tolerance and abs(max_val - last_max) <= tolerance:
+                return
+        self._y_range = (min_val, max_val)
+        margin = (max_val - min_val) * 0.1 + 1
+        self.plot_widget.setYRange(min_val - margin, max_val + margin)
+
+    def get_history(self):
+        """按时间顺序返回 (时间戳, 位置) 历史数据"""
+        if self._count < self.max_history_points:
+            # 缓冲区未写满，数据本身就是连续有序的
+            return self._tbuf[:self._count], self._buf[:self._count]
+
+        # 缓冲区已写满，最旧的数据从 head 开始
+        head = self._head
+        times = np.concatenate((self._tbuf[head:], self._tbuf[:head]))
+        positions = np.concatenate((self._buf[head:], self._buf[:head]))
+        return times, positions
 
     def clear_history(self):
         """清除历史数据"""
-        self.position_history.clear()
-        self.time_history.clear()
+        self._head = 0
+        self._count = 0
+        self._seq = 0
+        self._sum = 0.0
+        self._max_dq.clear()
+        self._min_dq.clear()
+        self._y_range = None
         self.plot_curve.setData([], [])
+        self._change_count = 0
         self.change_count_label.setText("0 次")
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] 历史数据已清除")
+        self.log_message("历史数据已清除")
 
     def update_frequency(self, value):
         """更新读取频率"""
         self.freq_label.setText(f"{value} ms")
         if self.data_reader:
-            self.data_reader.msleep(value)
+            self.data_reader.set_poll_interval(value)
+
+    def update_decimation(self, value):
+        """更新显示抽样间隔"""
+        self.display_decimation = value
+        self._samples_since_display = 0
 
     def closeEvent(self, event):
         """窗口关闭事件"""
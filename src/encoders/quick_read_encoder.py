@@ -4,20 +4,28 @@
 快速读取右缸编码器位置 - 简化版
 """
 
+import struct
+from functools import lru_cache
 import snap7
-from snap7.util import get_real
 import yaml
 from pathlib import Path
 
 # 获取项目根目录
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+# REAL (大端 IEEE-754 单精度) 解包函数，模块加载时编译一次
+_REAL_UNPACK = struct.Struct('>f').unpack_from
+
+# 优先使用 libyaml C 解析器，不可用时回退到纯 Python 实现
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+@lru_cache(maxsize=1)
 def load_config():
-    """加载配置文件"""
+    """加载配置文件（结果缓存，只解析一次）"""
     config_file = PROJECT_ROOT / "config" / "encoder_config.yaml"
     if config_file.exists():
         with open(config_file, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YAML_LOADER)
     else:
         # 默认配置
         return {
@@ -33,59 +41,101 @@ def load_config():
             }
         }
 
-def read_encoder_position():
-    """读取右缸编码器位置"""
+class EncoderReader:
+    """右缸编码器读取器，在多次读取之间保持同一个 PLC 连接"""
+
+    def __init__(self, config=None):
+        config = config or load_config()
+        self.plc_config = config['plc']
+        self.data_config = config['data']
+        self.client = snap7.client.Client()
+
+    def connect(self):
+        """连接 PLC，返回是否连接成功"""
+        if not self.client.get_connected():
+            self.client.connect(
+                self.plc_config['ip_address'],
+                self.plc_config['rack'],
+                self.plc_config['slot']
+            )
+        return self.client.get_connected()
+
+    def disconnect(self):
+        """断开 PLC 连接"""
+        self.client.disconnect()
+
+    def read_raw(self):
+        """读取编码器位置的原始字节数据"""
+        return self.client.db_read(
+            self.data_config['db_number'],
+            self.data_config['offset'],
+            self.data_config['data_size']
+        )
 
-    # 加载配置
-    config = load_config()
-    plc_config = config['plc']
-    data_config = config['data']
+    @staticmethod
+    def decode(data):
+        """将 read_raw 返回的原始字节数据转换为位置值(mm)"""
+        return _REAL_UNPACK(data, 0)[0]
+
+    def read(self):
+        """读取编码器位置(mm)"""
+        return self.decode(self.read_raw())
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+        return False
+
+def read_encoder_position(reader=None):
+    """
+    读取右缸编码器位置
+
+    Args:
+        reader: 已连接的 EncoderReader，循环调用时传入以复用连接；
+                为 None 时临时建立连接，读取后断开
+    """
+    if reader is None:
+        reader = EncoderReader()
+        try:
+            return read_encoder_position(reader)
+        finally:
+            reader.disconnect()
+
+    plc_config = reader.plc_config
+    data_config = reader.data_config
 
     print(f"连接 PLC: {plc_config['ip_address']}")
     print(f"读取地址: DB{data_config['db_number']}.DBD{data_config['offset']}")
 
-    # 创建客户端
-    client = snap7.client.Client()
-
     try:
-        # 连接 PLC
-        client.connect(
-            plc_config['ip_address'],
-            plc_config['rack'],
-            plc_config['slot']
-        )
-
-        # 检查连接状态
-        if client.get_connected():
+        # 连接 PLC（已连接时直接复用）
+        if reader.connect():
             print("✅ PLC 连接成功")
 
             # 读取数据
-            data = client.db_read(
-                data_config['db_number'],
-                data_config['offset'],
-                data_config['data_size']
-            )
+            data = reader.read_raw()
 
             print(f"原始数据: {data.hex()}")
 
             # 转换为 Real 值
-            position = get_real(data, 0)
+            position = reader.decode(data)
             print(f"🎯 右缸编码器反馈位置: {position:.3f} mm")
 
             return position
 
         else:
-            print(f"❌ PLC 连接失败，连接状态: {client.get_connected()}")
+            print(f"❌ PLC 连接失败，连接状态: {reader.client.get_connected()}")
             # 获取详细错误信息
-            error_code = client.ErrorText()
+            error_code = reader.client.ErrorText()
             print(f"❌ 错误信息: {error_code}")
             return None
 
     except Exception as e:
         print(f"❌ 读取异常: {e}")
         return None
-    finally:
-        client.disconnect()
 
 if __name__ == "__main__":
     print("=" * 50)
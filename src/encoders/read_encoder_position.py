@@ -6,35 +6,202 @@
 """
 
 import sys
+import math
 import time
+import ctypes
+import random
+import struct
+import threading
 from datetime import datetime
 from pathlib import Path
 from loguru import logger
 import snap7
-from snap7.util import get_real
+try:
+    from snap7.types import Areas as Area, WordLen, S7DataItem
+    # python-snap7 1.x 的参数编号是模块级整数常量
+    from snap7.types import PingTimeout, SendTimeout, RecvTimeout
+except ImportError:  # python-snap7 >= 2.0
+    from snap7.type import Area, WordLen, S7DataItem, Parameter
+    PingTimeout = Parameter.PingTimeout
+    SendTimeout = Parameter.SendTimeout
+    RecvTimeout = Parameter.RecvTimeout
 
 # 获取项目根目录
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
-# 配置日志
-logger.remove()
-logger.add(
-    sys.stdout,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{message}</cyan>",
-    level="INFO"
-)
-logger.add(
-    PROJECT_ROOT / "data" / "encoder_position.log",
-    rotation="10 MB",
-    retention="7 days",
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}",
-    level="DEBUG"
-)
+# 单次 read_multi_vars 请求的最大变量数（S7 协议限制）
+MAX_VARS_PER_REQUEST = 20
+
+# 数据文件刷新策略：累计 N 条或超过 T 秒刷新一次
+DATA_FLUSH_SAMPLES = 1000
+DATA_FLUSH_INTERVAL = 1.0
+
+# 记录采样时的位置合理范围(mm)，超出范围的采样在写盘时计数
+RECORD_VALID_RANGE = (-1000.0, 1000.0)
+
+# 连续监控汇总日志间隔(纳秒)
+SUMMARY_INTERVAL_NS = 1_000_000_000
+
+# REAL (大端 IEEE-754 单精度) 解包函数，模块加载时编译一次
+_REAL_UNPACK = struct.Struct('>f').unpack_from
+
+
+def _setup_logging():
+    """配置日志（仅在作为脚本运行时调用，导入模块或 --help 时不打开日志文件）"""
+    logger.remove()
+    logger.add(
+        sys.stdout,
+        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{message}</cyan>",
+        level="INFO"
+    )
+    logger.add(
+        PROJECT_ROOT / "data" / "encoder_position.log",
+        rotation="10 MB",
+        retention="7 days",
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}",
+        level="INFO",  # 逐次读取的 DEBUG 日志不写入文件，loguru 也不会格式化它们
+        enqueue=True  # 在后台线程中格式化并写入文件，不阻塞读取
+    )
+
+
+def validate_range_vec(positions, min_val=-1000.0, max_val=1000.0):
+    """
+    批量验证位置值是否在合理范围内（向量化版 validate_position_range）
+
+    Args:
+        positions: 位置值数组 (numpy.ndarray)
+        min_val: 最小值
+        max_val: 最大值
+
+    Returns:
+        numpy.ndarray: 布尔掩码，True 表示在范围内
+    """
+    return (positions >= min_val) & (positions <= max_val)
+
+
+class SampleRecorder:
+    """
+    编码器采样记录器
+
+    读取线程把采样写入固定大小的环形缓冲区，后台线程定期把新数据批量写入二进制文件。
+    每条记录为 (int64 时间戳 ns, float32 位置)。缓冲区满时丢弃新采样并计数，不阻塞读取。
+    缓冲区按字段分开存储（时间戳数组 + 位置数组），只在写盘时交织成记录。
+    指定 quantize_scale 时位置在缓冲区中以 int16 定点数存储（写盘时还原为 float32）。
+    """
+
+    RECORD_DTYPE = [('t', '<i8'), ('v', '<f4')]
+
+    def __init__(self, filename, capacity=4096, flush_interval=0.1, valid_range=None,
+                 quantize_scale=None):
+        """
+        Args:
+            filename: 二进制数据文件路径（追加写入）
+            capacity: 环形缓冲区容量，必须为 2 的幂
+            flush_interval: 后台写盘间隔(秒)
+            valid_range: (最小值, 最大值)，写盘时批量统计超出范围的采样数；None 表示不检查
+            quantize_scale: 定点量化系数(计数/mm)，如 100 表示 0.01 mm 分辨率、±327.67 mm 量程；
+                            None 表示按 float32 存储
+        """
+        import numpy as np  # 可选依赖，仅在启用记录时需要
+
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError("capacity 必须为 2 的幂")
+
+        self._np = np
+        self._ts = np.empty(capacity, dtype=np.int64)
+        self._val = np.empty(capacity, dtype=np.int16 if quantize_scale else np.float32)
+        self.quantize_scale = quantize_scale
+        self._mask = capacity - 1
+        self._head = 0  # 已写入采样总数（仅读取线程修改）
+        self._tail = 0  # 已写盘采样总数（仅写盘线程修改）
+        self.dropped = 0
+        self.out_of_range = 0
+        self.overflow_count = 0  # 量化时超出 int16 范围（已截断）或非有限值（已丢弃）的采样数
+        self.valid_range = valid_range
+        self.flush_interval = flush_interval
+
+        self._file = open(filename, "ab")
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="SampleRecorder", daemon=True)
+        self._thread.start()
+
+    def push(self, timestamp_ns, position):
+        """写入一个采样（缓冲区满时丢弃）"""
+        head = self._head
+        if head - self._tail > self._mask:
+            self.dropped += 1
+            return
+        if self.quantize_scale:
+            # NaN/±inf 无法量化为整数，直接丢弃
+            if not math.isfinite(position):
+                self.overflow_count += 1
+                return
+            position = round(position * self.quantize_scale)
+            if not -32768 <= position <= 32767:
+                self.overflow_count += 1
+                position = max(-32768, min(32767, position))
+
+        i = head & self._mask
+        self._ts[i] = timestamp_ns
+        self._val[i] = position
+        self._head = head + 1
+
+    def drain(self):
+        """将缓冲区中尚未写盘的采样批量写入文件"""
+        head = self._head
+        tail = self._tail
+        if head == tail:
+            return
+        # 未写盘数据在环形缓冲区中最多分成两段连续区域
+        start = tail & self._mask
+        end = start + (head - tail)
+        capacity = self._mask + 1
+        if end <= capacity:
+            segments = ((start, end),)
+        else:
+            segments = ((start, capacity), (0, end - capacity))
+
+        for a, b in segments:
+            values = self._val[a:b]
+            if self.quantize_scale:
+                values = values.astype(self._np.float32) / self.quantize_scale
+
+            # 写盘时才把两个字段交织成记录
+            records = self._np.empty(b - a, dtype=self.RECORD_DTYPE)
+            records['t'] = self._ts[a:b]
+            records['v'] = values
+            records.tofile(self._file)
+
+            # 在写盘线程中批量检查数据范围，不占用读取线程
+            if self.valid_range is not None:
+                in_range = validate_range_vec(values, *self.valid_range)
+                self.out_of_range += len(in_range) - int(self._np.count_nonzero(in_range))
+
+        self._tail = head
+
+    def _run(self):
+        """后台写盘线程"""
+        while not self._stop_event.wait(self.flush_interval):
+            self.drain()
+
+    def close(self):
+        """停止后台线程，写入剩余数据并关闭文件"""
+        self._stop_event.set()
+        self._thread.join()
+        self.drain()
+        self._file.close()
+        if self.dropped:
+            logger.warning(f"记录缓冲区溢出，丢弃采样 {self.dropped} 个")
+        if self.out_of_range:
+            logger.warning(f"记录的采样中有 {self.out_of_range} 个超出合理范围 {self.valid_range}")
+        if self.overflow_count:
+            logger.warning(f"有 {self.overflow_count} 个采样超出 int16 量化范围（已截断）或为非有限值（已丢弃）")
+
 
 class EncoderPositionReader:
     """编码器位置读取器"""
 
-    def __init__(self, plc_ip="192.168.0.1", rack=0, slot=1):
+    def __init__(self, plc_ip="192.168.0.1", rack=0, slot=1, timeout_ms=None):
         """
         初始化编码器位置读取器
 
@@ -42,10 +209,12 @@ class EncoderPositionReader:
             plc_ip: PLC IP地址
             rack: 机架号 (默认0)
             slot: 槽位号 (默认1)
+            timeout_ms: 连接/收发超时(毫秒)，None 使用 snap7 默认值
         """
         self.plc_ip = plc_ip
         self.rack = rack
         self.slot = slot
+        self.timeout_ms = timeout_ms
         self.client = snap7.client.Client()
         self.is_connected = False
 
@@ -55,6 +224,18 @@ class EncoderPositionReader:
         self.encoder_offset = 124  # 根据图片信息，偏移量为124
         self.data_size = 4  # Real 类型占用 4 字节
 
+        # read_multi_vars 使用的变量数组及数据缓冲区（按需创建后复用）
+        self._items = None
+        self._item_buffers = None
+
+        # 数据文件（保持打开，带缓冲写入）
+        self._data_file = None
+        self._data_filename = None
+        self._samples_since_flush = 0
+        self._last_flush = 0.0
+        self._ts_cache_seconds = None
+        self._ts_cache_prefix = ""
+
         logger.info(f"编码器位置读取器初始化完成")
         logger.info(f"PLC IP: {self.plc_ip}")
         logger.info(f"读取地址: DB{self.db_number}.DBD{self.encoder_offset}")
@@ -64,6 +245,13 @@ class EncoderPositionReader:
         """连接到 PLC"""
         try:
             logger.info(f"正在连接 PLC: {self.plc_ip}")
+
+            # snap7 已在其套接字上设置 TCP_NODELAY；这里只需缩短超时，
+            # 使网络异常时读取尽快失败，而不是阻塞数秒
+            if self.timeout_ms is not None:
+                for param in (PingTimeout, SendTimeout, RecvTimeout):
+                    self.client.set_param(param, self.timeout_ms)
+
             self.client.connect(self.plc_ip, self.rack, self.slot)
 
             # 检查连接状态
@@ -106,30 +294,128 @@ class EncoderPositionReader:
 
         try:
             # 读取 DB5 中的编码器位置数据
-            logger.debug(f"读取 DB{self.db_number}.DBD{self.encoder_offset}")
+            # 注：不直接调用 Cli_DBRead 读入复用缓冲区 —— 客户端的 ctypes 句柄属性名随
+            # python-snap7 版本变化（1.3 为 _library/_pointer，1.4/2.x 为 _lib/_s7_client，
+            # 3.x 不再使用 ctypes），只能使用公开的 db_read
+            logger.debug("读取 DB{}.DBD{}", self.db_number, self.encoder_offset)
             data = self.client.db_read(self.db_number, self.encoder_offset, self.data_size)
 
-            if len(data) == self.data_size:
-                # 将字节数据转换为 Real 类型
-                position = get_real(data, 0)
-                logger.debug(f"原始数据: {data.hex()}")
-                logger.info(f"右缸编码器反馈位置: {position} mm")
-                return position
-            else:
+            if len(data) != self.data_size:
                 logger.error(f"读取数据长度不正确: 期望 {self.data_size} 字节, 实际 {len(data)} 字节")
                 return None
 
+            # 将字节数据转换为 Real 类型
+            position = _REAL_UNPACK(data)[0]
+            logger.opt(lazy=True).debug("原始数据: {}", lambda: data.hex())
+            # 每次读取的结果只在 TRACE 级别输出（loguru 在级别未启用时不会格式化）
+            logger.trace("右缸编码器反馈位置: {} mm", position)
+            return position
+
         except Exception as e:
             logger.error(f"读取编码器位置失败: {e}")
             return None
 
-    def read_position_with_retry(self, max_retries=3, retry_delay=1.0) -> float:
+    def make_fast_reader(self):
+        """
+        生成绑定当前 DB 号/偏移地址的快速读取函数，供连续监控等热路径使用
+
+        所有参数在生成时固定（之后修改 encoder_offset 需重新生成），
+        调用时不再做属性查找和连接状态检查。
+
+        Returns:
+            callable: 无参函数，返回编码器位置值，失败返回 None
+        """
+        db_read = self.client.db_read
+        db_number = self.db_number
+        offset = self.encoder_offset
+        size = self.data_size
+        unpack = _REAL_UNPACK
+
+        def fast_read():
+            try:
+                return unpack(db_read(db_number, offset, size))[0]
+            except Exception as e:
+                logger.error(f"读取编码器位置失败: {e}")
+                return None
+
+        return fast_read
+
+    def read_raw_offsets(self, offsets):
         """
-        带重试机制的读取
+        通过 read_multi_vars 一次请求读取当前 DB 块中多个 Real 变量的原始字节
+
+        Args:
+            offsets: 偏移地址列表，最多 MAX_VARS_PER_REQUEST 个
+
+        Returns:
+            list: 各地址的原始字节数据（单个地址读取失败时为 None），请求失败返回 None
+        """
+        if not self.is_connected:
+            logger.error("PLC 未连接")
+            return None
+
+        if len(offsets) > MAX_VARS_PER_REQUEST:
+            raise ValueError(f"单次最多读取 {MAX_VARS_PER_REQUEST} 个变量")
+
+        items, buffers = self._get_items(len(offsets))
+        for item, offset in zip(items, offsets):
+            item.DBNumber = self.db_number
+            item.Start = offset
+
+        try:
+            self.client.read_multi_vars(items)
+        except Exception as e:
+            logger.error(f"批量读取失败: {e}")
+            return None
+
+        raw = []
+        for item, buffer in zip(items, buffers):
+            if item.Result != 0:
+                logger.warning(f"读取 DB{item.DBNumber}.DBD{item.Start} 失败, 错误码: {item.Result}")
+                raw.append(None)
+            else:
+                raw.append(buffer.raw)
+        return raw
+
+    def read_real_offsets(self, offsets):
+        """
+        通过 read_multi_vars 一次请求读取当前 DB 块中多个 Real 变量
+
+        Args:
+            offsets: 偏移地址列表，最多 MAX_VARS_PER_REQUEST 个
+
+        Returns:
+            list: 各地址的 Real 值（单个地址读取失败时为 None），请求失败返回 None
+        """
+        raw = self.read_raw_offsets(offsets)
+        if raw is None:
+            return None
+        return [None if data is None else _REAL_UNPACK(data)[0] for data in raw]
+
+    def _get_items(self, count):
+        """获取 count 个 Real 变量的 S7DataItem 数组，数量不变时复用"""
+        if self._items is None or len(self._items) != count:
+            items = (S7DataItem * count)()
+            buffers = []
+            for item in items:
+                buffer = ctypes.create_string_buffer(self.data_size)
+                item.Area = Area.DB.value
+                item.WordLen = WordLen.Byte.value
+                item.Amount = self.data_size
+                item.pData = ctypes.cast(ctypes.pointer(buffer), ctypes.POINTER(ctypes.c_uint8))
+                buffers.append(buffer)
+            self._items = items
+            self._item_buffers = buffers
+        return self._items, self._item_buffers
+
+    def read_position_with_retry(self, max_retries=3, retry_delay=0.05, max_delay=2.0) -> float:
+        """
+        带重试机制的读取（指数退避 + 随机抖动）
 
         Args:
             max_retries: 最大重试次数
-            retry_delay: 重试延迟时间(秒)
+            retry_delay: 首次重试的基础延迟时间(秒)，之后每次翻倍
+            max_delay: 最大延迟时间(秒)
 
         Returns:
             float: 编码器位置值
@@ -144,27 +430,55 @@ class EncoderPositionReader:
                 logger.error(f"第 {attempt + 1} 次读取失败: {e}")
 
             if attempt < max_retries - 1:
-                logger.info(f"等待 {retry_delay} 秒后重试...")
-                time.sleep(retry_delay)
+                # 连接已断开时先重连，而不是单纯等待
+                if not self.client.get_connected():
+                    logger.warning("PLC 连接已断开，尝试重新连接...")
+                    self.is_connected = False
+                    self.connect()
+
+                delay = min(retry_delay * (2 ** attempt), max_delay) * (0.5 + random.random() * 0.5)
+                logger.info(f"等待 {delay:.3f} 秒后重试...")
+                time.sleep(delay)
 
         logger.error("所有重试均失败")
         return None
 
-    def continuous_monitoring(self, interval=1.0, duration=None):
+    def continuous_monitoring(self, interval=1.0, duration=None, record_file=None,
+                              quantize_scale=None):
         """
         连续监控编码器位置
 
         Args:
             interval: 读取间隔时间(秒)
             duration: 监控持续时间(秒), None 表示无限监控
+            record_file: 采样记录文件（二进制，见 SampleRecorder），None 表示不记录
+            quantize_scale: 记录缓冲区定点量化系数(计数/mm)，None 表示按 float32 缓存
         """
         logger.info(f"开始连续监控，间隔: {interval} 秒")
 
+        recorder = None
         start_time = time.time()
         read_count = 0
         success_count = 0
 
+        # 按固定时间网格调度（整数纳秒），读取耗时不会累积成周期漂移
+        interval_ns = int(interval * 1e9)
+        next_ns = time.monotonic_ns()
+
+        # 每秒输出一次汇总统计，代替逐次读取的日志
+        summary_ns = next_ns + SUMMARY_INTERVAL_NS
+        window_min = window_max = None
+        window_sum = 0.0
+        window_count = 0
+
         try:
+            if record_file:
+                recorder = SampleRecorder(record_file, valid_range=RECORD_VALID_RANGE,
+                                          quantize_scale=quantize_scale)
+
+            # 已连接时使用绑定了地址参数的快速读取函数
+            read_position = self.make_fast_reader() if self.is_connected else self.read_encoder_position
+
             while True:
                 current_time = time.time()
 
@@ -174,43 +488,110 @@ class EncoderPositionReader:
                     break
 
                 # 读取位置
-                position = self.read_encoder_position()
+                position = read_position()
                 read_count += 1
 
                 if position is not None:
                     success_count += 1
-                    # 在这里可以添加数据处理逻辑，如保存到文件、发送到其他系统等
-                    # self.save_position_to_file(position, datetime.now())
+                    if recorder is not None:
+                        recorder.push(time.time_ns(), position)
+                    logger.debug("右缸编码器反馈位置: {} mm", position)
+
+                    if window_count == 0:
+                        window_min = window_max = position
+                    elif position < window_min:
+                        window_min = position
+                    elif position > window_max:
+                        window_max = position
+                    window_sum += position
+                    window_count += 1
                 else:
                     logger.warning("读取失败")
 
-                # 等待下一次读取
-                time.sleep(interval)
+                if window_count and time.monotonic_ns() >= summary_ns:
+                    logger.info(
+                        "右缸编码器反馈位置: 最小 {:.3f} / 最大 {:.3f} / 平均 {:.3f} mm ({} 次)",
+                        window_min, window_max, window_sum / window_count, window_count
+                    )
+                    summary_ns = time.monotonic_ns() + SUMMARY_INTERVAL_NS
+                    window_sum = 0.0
+                    window_count = 0
+
+                # 等待到下一个调度时刻
+                next_ns += interval_ns
+                delay_ns = next_ns - time.monotonic_ns()
+                if delay_ns > 0:
+                    time.sleep(delay_ns / 1e9)
+                else:
+                    logger.warning(f"读取周期超时 {-delay_ns / 1e9:.3f} 秒")
+                    next_ns = time.monotonic_ns()
 
         except KeyboardInterrupt:
             logger.info("用户中断监控")
         except Exception as e:
             logger.error(f"监控过程异常: {e}")
         finally:
+            if recorder is not None:
+                recorder.close()
             success_rate = (success_count / read_count * 100) if read_count > 0 else 0
             logger.info(f"监控结束，总读取次数: {read_count}, 成功次数: {success_count}, 成功率: {success_rate:.1f}%")
 
-    def save_position_to_file(self, position: float, timestamp: datetime, filename="encoder_data.txt"):
+    def save_position_to_file(self, position: float, timestamp=None, filename="encoder_data.txt"):
         """
         保存位置数据到文件
 
         Args:
             position: 位置值
-            timestamp: 时间戳
+            timestamp: 时间戳，time.time_ns() 整数纳秒或 datetime；None 表示当前时间
             filename: 文件名
         """
+        if timestamp is None:
+            timestamp = time.time_ns()
+        if isinstance(timestamp, datetime):
+            timestamp_str = timestamp.isoformat()
+        else:
+            timestamp_str = self._format_timestamp(timestamp)
+
         try:
-            with open(filename, "a", encoding="utf-8") as f:
-                f.write(f"{timestamp.isoformat()},{position:.3f}\n")
-            logger.debug(f"数据已保存到 {filename}")
+            if self._data_file is None or filename != self._data_filename:
+                self.close_data_file()
+                self._data_file = open(filename, "a", encoding="utf-8", buffering=64 * 1024)
+                self._data_filename = filename
+                self._last_flush = time.monotonic()
+
+            self._data_file.write(f"{timestamp_str},{position:.3f}\n")
+            self._samples_since_flush += 1
+
+            # 批量刷新到磁盘
+            now = time.monotonic()
+            if (self._samples_since_flush >= DATA_FLUSH_SAMPLES
+                    or now - self._last_flush >= DATA_FLUSH_INTERVAL):
+                self._data_file.flush()
+                self._samples_since_flush = 0
+                self._last_flush = now
+                logger.debug("数据已保存到 {}", filename)
         except Exception as e:
             logger.error(f"保存文件失败: {e}")
 
+    def _format_timestamp(self, timestamp_ns):
+        """将纳秒时间戳格式化为 ISO 格式本地时间；同一秒内复用 strftime 结果"""
+        seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+        if seconds != self._ts_cache_seconds:
+            self._ts_cache_seconds = seconds
+            self._ts_cache_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(seconds))
+        return f"{self._ts_cache_prefix}.{nanos // 1000:06d}"
+
+    def close_data_file(self):
+        """刷新并关闭数据文件"""
+        if self._data_file is not None:
+            try:
+                self._data_file.close()
+            except Exception as e:
+                logger.error(f"关闭数据文件失败: {e}")
+            self._data_file = None
+            self._data_filename = None
+            self._samples_since_flush = 0
+
     def validate_position_range(self, position: float, min_val=-1000.0, max_val=1000.0) -> bool:
         """
         验证位置值是否在合理范围内
@@ -262,6 +643,7 @@ class EncoderPositionReader:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """上下文管理器退出"""
+        self.close_data_file()
         self.disconnect()
 
 
@@ -323,17 +705,19 @@ def test_configuration():
             print("连接失败")
             return
 
-        for offset in test_offsets:
-            reader.encoder_offset = offset
-            print(f"\n测试偏移地址 {offset}:")
+        # 所有偏移地址合并为一次 read_multi_vars 请求
+        raw = reader.read_raw_offsets(test_offsets)
+        if raw is None:
+            print("批量读取失败")
+            return
 
-            data = reader.client.db_read(reader.db_number, offset, 4)
-            print(f"原始数据: {data.hex()}")
+        for offset, data in zip(test_offsets, raw):
+            print(f"\n测试偏移地址 {offset}:")
 
-            try:
-                value = get_real(data, 0)
-                print(f"Real 值: {value}")
-            except:
+            if data is not None:
+                print(f"原始数据: {data.hex()}")
+                print(f"Real 值: {_REAL_UNPACK(data)[0]}")
+            else:
                 print("无法解析为 Real 类型")
 
 
@@ -348,8 +732,13 @@ if __name__ == "__main__":
                        help="PLC IP 地址 (默认: 192.168.0.1)")
     parser.add_argument("--offset", type=int, default=20,
                        help="编码器数据偏移地址 (默认: 20)")
+    parser.add_argument("--record", metavar="FILE",
+                       help="连续监控时将采样记录到二进制文件")
+    parser.add_argument("--quantize", type=float, metavar="SCALE",
+                       help="记录时以 int16 定点数缓存位置，SCALE 为计数/mm (如 100 表示 0.01 mm 分辨率)")
 
     args = parser.parse_args()
+    _setup_logging()
 
     if args.test:
         test_configuration()
@@ -357,6 +746,7 @@ if __name__ == "__main__":
         with EncoderPositionReader(plc_ip=args.ip) as reader:
             reader.encoder_offset = args.offset
             print(f"\n开始监控 DB{reader.db_number}.DBD{args.offset}")
-            reader.continuous_monitoring(interval=1.0, duration=args.monitor)
+            reader.continuous_monitoring(interval=1.0, duration=args.monitor,
+                                         record_file=args.record, quantize_scale=args.quantize)
     else:
         main()
\ No newline at end of file
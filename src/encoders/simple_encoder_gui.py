@@ -6,53 +6,190 @@
 """
 
 import sys
+import time
+import struct
+import threading
+from array import array
+from collections import deque
 from datetime import datetime
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget,
     QLabel, QPushButton, QGroupBox, QGridLayout,
-    QTextEdit, QSlider, QSpinBox, QFrame
+    QPlainTextEdit, QSlider, QSpinBox, QFrame
 )
-from PyQt6.QtCore import QTimer, QThread, pyqtSignal, Qt
-from PyQt6.QtGui import QFont, QPalette, QColor, QPainter, QPen
+from PyQt6.QtCore import QTimer, QThread, pyqtSignal, Qt, QPointF, QLineF
+from PyQt6.QtGui import QFont, QPalette, QColor, QPainter, QPen, QPolygonF, QPixmap
 import snap7
-from snap7.util import get_real
 import math
 
 
+# 编码器位置所在的 DB 块及偏移（REAL，4 字节）
+POSITION_DB = 5
+POSITION_OFFSET = 124
+
+# 预编译的大端 REAL 解码器，避免每次读取都重新解析格式字符串
+_REAL_UNPACK = struct.Struct('>f').unpack_from
+
+# 读取周期（秒），读取耗时计入周期内
+POLL_INTERVAL = 0.1
+
+# 重连退避时间范围（秒），每次失败后翻倍
+RECONNECT_BACKOFF_MIN = 0.1
+RECONNECT_BACKOFF_MAX = 5.0
+
+# 曲线最短重绘间隔（毫秒），约 30 FPS
+REPAINT_INTERVAL_MS = 33
+
+
+class RingBuffer:
+    """定长环形缓冲区（预分配 float32 数组，添加/淘汰均为 O(1)）"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._buf = array('f', bytes(4 * capacity))
+        self._head = 0   # 下一个写入位置
+        self._count = 0  # 有效数据个数
+
+    def append(self, value):
+        """添加一个值，缓冲区已满时覆盖最旧的值"""
+        self._buf[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def values(self):
+        """按时间顺序返回所有数据"""
+        if self._count < self.capacity:
+            return self._buf[:self._count]
+        return self._buf[self._head:] + self._buf[:self._head]
+
+    def clear(self):
+        """清空缓冲区"""
+        self._head = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+
+class SlidingMinMax:
+    """滑动窗口最大/最小值（单调队列，每次添加均摊 O(1)）"""
+
+    def __init__(self, window):
+        self.window = window
+        self._seq = 0
+        self._max_dq = deque()  # (序号, 值)，值单调递减
+        self._min_dq = deque()  # (序号, 值)，值单调递增
+
+    def add(self, value):
+        """添加一个值，超出窗口的旧值自动移出"""
+        seq = self._seq
+        self._seq += 1
+
+        while self._max_dq and self._max_dq[-1][1] <= value:
+            self._max_dq.pop()
+        self._max_dq.append((seq, value))
+        while self._min_dq and self._min_dq[-1][1] >= value:
+            self._min_dq.pop()
+        self._min_dq.append((seq, value))
+
+        oldest = seq - self.window
+        if self._max_dq[0][0] <= oldest:
+            self._max_dq.popleft()
+        if self._min_dq[0][0] <= oldest:
+            self._min_dq.popleft()
+
+    def clear(self):
+        """清空窗口"""
+        self._seq = 0
+        self._max_dq.clear()
+        self._min_dq.clear()
+
+    @property
+    def max(self):
+        return self._max_dq[0][1]
+
+    @property
+    def min(self):
+        return self._min_dq[0][1]
+
+
 class SimplePlotWidget(QFrame):
     """简单的实时绘图组件"""
 
     def __init__(self):
         super().__init__()
         self.setMinimumHeight(300)
-        self.data_points = []
         self.max_points = 500
+        self.data_points = RingBuffer(self.max_points)
+        self._minmax = SlidingMinMax(self.max_points)
         self.x_scale = 1.0
         self.y_scale = 1.0
         self.y_offset = 0
+        # 背景和网格不随数据变化，预先渲染到位图中，每帧只需贴图
+        self._grid_pixmap = None
+        # 画笔只创建一次，避免每帧重复分配
+        self._grid_pen = QPen(QColor(129, 161, 193, 50))
+        self._mid_pen = QPen(QColor(129, 161, 193, 100))
+        self._data_pen = QPen(QColor(136, 192, 208), 2)
+        # 每次重绘都会完整覆盖控件区域，无需 Qt 预先擦除背景
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        # 高频刷新时关闭抗锯齿，锯齿线绘制开销小得多
+        self.antialiasing = False
+        # 重绘节流：新数据到达后最多每 REPAINT_INTERVAL_MS 重绘一次，多个数据点合并为一帧
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(REPAINT_INTERVAL_MS)
+        self._repaint_timer.timeout.connect(self.update)
 
     def add_data_point(self, value):
         """添加数据点"""
         self.data_points.append(value)
-        if len(self.data_points) > self.max_points:
-            self.data_points.pop(0)
-        self.update()
+        self._minmax.add(value)
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
 
     def clear_data(self):
         """清除数据"""
         self.data_points.clear()
+        self._minmax.clear()
         self.update()
 
+    def resizeEvent(self, event):
+        """尺寸变化时重新生成背景网格位图"""
+        super().resizeEvent(event)
+        self._render_grid_pixmap()
+
+    def _render_grid_pixmap(self):
+        """将背景和网格渲染到缓存位图"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QColor(46, 52, 64))
+
+        painter = QPainter(pixmap)
+        self.draw_grid(painter)
+        painter.end()
+
+        self._grid_pixmap = pixmap
+
     def paintEvent(self, event):
         """绘制事件"""
+        # 窗口移到不同 DPI 的屏幕时缩放比例会变化，需要按新比例重新渲染
+        if (self._grid_pixmap is None
+                or self._grid_pixmap.devicePixelRatio() != self.devicePixelRatioF()):
+            self._render_grid_pixmap()
+
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # 背景
-        painter.fillRect(self.rect(), QColor(46, 52, 64))
+        # 背景和网格（缓存位图不透明，直接覆盖无需混合）
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.drawPixmap(0, 0, self._grid_pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
 
-        # 绘制网格
-        self.draw_grid(painter)
+        if self.antialiasing:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # 绘制数据
         if len(self.data_points) > 1:
@@ -60,54 +197,45 @@ class SimplePlotWidget(QFrame):
 
     def draw_grid(self, painter):
         """绘制网格"""
-        pen = QPen(QColor(129, 161, 193, 50))
-        painter.setPen(pen)
-
         width = self.width()
         height = self.height()
 
-        # 垂直网格线
-        for i in range(0, width, 50):
-            painter.drawLine(i, 0, i, height)
-
-        # 水平网格线
-        for i in range(0, height, 50):
-            painter.drawLine(0, i, width, i)
+        # 垂直和水平网格线一次性批量绘制
+        grid_lines = [QLineF(i, 0, i, height) for i in range(0, width, 50)]
+        grid_lines += [QLineF(0, i, width, i) for i in range(0, height, 50)]
+        painter.setPen(self._grid_pen)
+        painter.drawLines(grid_lines)
 
         # 中心线
-        pen = QPen(QColor(129, 161, 193, 100))
-        painter.setPen(pen)
-        painter.drawLine(0, height // 2, width, height // 2)
+        painter.setPen(self._mid_pen)
+        painter.drawLine(QLineF(0, height / 2, width, height / 2))
 
     def draw_data(self, painter):
         """绘制数据曲线"""
-        pen = QPen(QColor(136, 192, 208), 2)
-        painter.setPen(pen)
+        painter.setPen(self._data_pen)
 
         width = self.width()
         height = self.height()
 
         # 计算缩放
-        if self.data_points:
-            min_val = min(self.data_points)
-            max_val = max(self.data_points)
+        if len(self.data_points):
+            min_val = self._minmax.min
+            max_val = self._minmax.max
             range_val = max_val - min_val
 
             if range_val > 0:
                 self.y_scale = (height - 40) / range_val
                 self.y_offset = min_val - (20 / self.y_scale)
 
-        # 绘制曲线
-        points = []
-        for i, value in enumerate(self.data_points):
-            x = (i / self.max_points) * width
-            y = height - ((value - self.y_offset) * self.y_scale) - 20
-            points.append((x, y))
-
-        if len(points) > 1:
-            for i in range(len(points) - 1):
-                painter.drawLine(int(points[i][0]), int(points[i][1]),
-                               int(points[i + 1][0]), int(points[i + 1][1]))
+        # 绘制曲线（整条折线一次绘制，而不是逐段 drawLine）
+        x_step = width / self.max_points
+        y_base = height - 20 + self.y_offset * self.y_scale
+        y_scale = self.y_scale
+        polyline = QPolygonF([
+            QPointF(i * x_step, y_base - value * y_scale)
+            for i, value in enumerate(self.data_points.values())
+        ])
+        painter.drawPolyline(polyline)
 
 
 class EncoderDataReader(QThread):
@@ -121,46 +249,67 @@ class EncoderDataReader(QThread):
         self.plc_ip = plc_ip
         self.is_running = False
         self.client = None
+        # 上一次发出的连接状态，状态不变时不重复发送信号
+        self._last_status = (None, None)
+        self._stop_event = threading.Event()  # 停止时立即结束等待
+        self._connected = False
+        self._backoff = RECONNECT_BACKOFF_MIN  # 当前重连等待时间（秒）
+
+    def _emit_status(self, connected, message):
+        """仅在连接状态或消息变化时发送 connection_status 信号"""
+        status = (connected, message)
+        if status != self._last_status:
+            self._last_status = status
+            self.connection_status.emit(connected, message)
 
     def run(self):
         """线程运行主循环"""
         self.is_running = True
+        self._last_status = (None, None)
+        self._stop_event.clear()
+        self._backoff = RECONNECT_BACKOFF_MIN
 
         while self.is_running:
+            cycle_start = time.monotonic()
             try:
+                # 复用同一个客户端对象，断线后只重新 connect
                 if self.client is None:
                     self.client = snap7.client.Client()
+                if not self._connected:
                     self.client.connect(self.plc_ip, 0, 1)
+                    self._connected = True
 
-                if self.client.get_connected():
-                    # 读取编码器位置
-                    data = self.client.db_read(5, 124, 4)
-                    position = get_real(data, 0)
-                    current_time = datetime.now()
-
-                    self.data_received.emit(position, current_time)
-                    self.connection_status.emit(True, "连接正常")
+                # 读取编码器位置
+                data = self.client.db_read(POSITION_DB, POSITION_OFFSET, 4)
+                (position,) = _REAL_UNPACK(data)
+                current_time = datetime.now()
 
-                else:
-                    self.connection_status.emit(False, "连接失败")
+                self.data_received.emit(position, current_time)
+                self._emit_status(True, "连接正常")
+                self._backoff = RECONNECT_BACKOFF_MIN
 
             except Exception as e:
-                self.connection_status.emit(False, f"错误: {str(e)}")
+                self._emit_status(False, f"错误: {str(e)}")
 
-                # 尝试重新连接
+                # 断开后按指数退避等待再重连，避免 PLC 离线时高频重试
+                self._connected = False
                 try:
-                    if self.client:
-                        self.client.disconnect()
-                    self.client = None
+                    self.client.disconnect()
                 except:
                     pass
+                self._stop_event.wait(self._backoff)
+                self._backoff = min(RECONNECT_BACKOFF_MAX, self._backoff * 2)
+                continue
 
-            # 控制读取频率 (100ms)
-            self.msleep(100)
+            # 控制读取频率 (100ms)，扣除本次读取耗时；stop() 可立即打断等待
+            remaining = POLL_INTERVAL - (time.monotonic() - cycle_start)
+            if remaining > 0:
+                self._stop_event.wait(remaining)
 
     def stop(self):
         """停止线程"""
         self.is_running = False
+        self._stop_event.set()
         try:
             if self.client:
                 self.client.disconnect()
@@ -172,16 +321,64 @@ class EncoderDataReader(QThread):
 class SimpleEncoderGUI(QMainWindow):
     """简化版编码器监控界面"""
 
+    # 样式表只构造一次，状态切换时直接复用
+    _START_BUTTON_STYLE = """
+        QPushButton {
+            background-color: #5E81AC;
+            color: white;
+            font-size: 14px;
+            font-weight: bold;
+            padding: 10px;
+            border-radius: 5px;
+        }
+        QPushButton:hover {
+            background-color: #81A1C1;
+        }
+    """
+    _STOP_BUTTON_STYLE = """
+        QPushButton {
+            background-color: #BF616A;
+            color: white;
+            font-size: 14px;
+            font-weight: bold;
+            padding: 10px;
+            border-radius: 5px;
+        }
+    """
+    _STATUS_OK_STYLE = "color: #A3BE8C; font-size: 14px; font-weight: bold;"
+    _STATUS_FAIL_STYLE = "color: #BF616A; font-size: 14px; font-weight: bold;"
+    _CHANGE_IDLE_STYLE = "color: #4C566A; font-size: 16px;"
+    _CHANGE_ACTIVE_STYLE = "color: #A3BE8C; font-size: 16px;"
+
     def __init__(self):
         super().__init__()
         self.data_reader = None
-        self.position_history = []
+        self.max_history = 500
+        self.position_history = RingBuffer(self.max_history)
+        self._history_minmax = SlidingMinMax(self.max_history)
         self.last_position = 0
         self.change_count = 0
         self.start_time = None
+        # 最近一次格式化的时间（同一秒内复用，避免重复 strftime）
+        self._time_key = None
+        self._time_text = ""
+        self._log_max_blocks = 500
+        # 当前已应用的样式状态（状态变化时才调用 setStyleSheet）
+        self._status_connected = None
+        self._change_active = False
 
         self.init_ui()
 
+    def _format_time(self, timestamp=None):
+        """返回 HH:MM:SS 格式的时间字符串，同一秒内直接复用缓存"""
+        if timestamp is None:
+            timestamp = datetime.now()
+        key = (timestamp.hour, timestamp.minute, timestamp.second)
+        if key != self._time_key:
+            self._time_key = key
+            self._time_text = "%02d:%02d:%02d" % key
+        return self._time_text
+
     def init_ui(self):
         """初始化用户界面"""
         self.setWindowTitle("右缸编码器实时监控 - 简化版")
@@ -190,47 +387,38 @@ class SimpleEncoderGUI(QMainWindow):
         # 中央部件
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
-        layout = QVBoxLayout(central_widget)
+        # 单层网格布局：4 行 2 列，避免多层嵌套布局在缩放时递归计算
+        grid = QGridLayout(central_widget)
 
         # 1. 状态栏
-        status_group = self.create_status_group()
-        layout.addWidget(status_group)
+        grid.addWidget(self.create_status_group(), 0, 0, 1, 2)
 
-        # 2. 主要显示区域
-        main_layout = QHBoxLayout()
-
-        # 左侧：位置显示
-        left_widget = self.create_position_widget()
-        main_layout.addWidget(left_widget, stretch=1)
-
-        # 右侧：实时曲线
-        right_widget = self.create_chart_widget()
-        main_layout.addWidget(right_widget, stretch=2)
-
-        layout.addLayout(main_layout)
+        # 2. 主要显示区域：左侧位置显示，右侧实时曲线
+        grid.addWidget(self.create_position_widget(), 1, 0)
+        grid.addWidget(self.create_chart_widget(), 1, 1)
 
         # 3. 控制和统计区域
-        control_stats_layout = QHBoxLayout()
-
-        # 控制面板
-        control_widget = self.create_control_widget()
-        control_stats_layout.addWidget(control_widget, stretch=1)
-
-        # 统计信息
-        stats_widget = self.create_stats_widget()
-        control_stats_layout.addWidget(stats_widget, stretch=1)
-
-        layout.addLayout(control_stats_layout)
+        grid.addWidget(self.create_control_widget(), 2, 0)
+        grid.addWidget(self.create_stats_widget(), 2, 1)
 
         # 4. 日志区域
-        log_widget = self.create_log_widget()
-        layout.addWidget(log_widget)
+        grid.addWidget(self.create_log_widget(), 3, 0, 1, 2)
+
+        grid.setColumnStretch(0, 1)
+        grid.setColumnStretch(1, 2)
+        grid.setRowStretch(1, 2)
+        grid.setRowStretch(3, 1)
 
         # 定时器更新统计
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_display)
         self.timer.start(1000)
 
+        # 变化指示器复位定时器（复用同一个单次定时器，避免每次变化都新建定时器和闭包）
+        self._reset_timer = QTimer(self)
+        self._reset_timer.setSingleShot(True)
+        self._reset_timer.timeout.connect(self._reset_change_indicator)
+
     def create_status_group(self):
         """状态显示组"""
         group = QGroupBox("连接状态")
@@ -244,6 +432,7 @@ class SimpleEncoderGUI(QMainWindow):
         layout.addWidget(self.time_label)
 
         layout.addStretch()
+        group.setLayout(layout)
         return group
 
     def create_position_widget(self):
@@ -268,11 +457,12 @@ class SimpleEncoderGUI(QMainWindow):
 
         # 变化指示
         self.change_indicator = QLabel("● 无变化")
-        self.change_indicator.setStyleSheet("color: #4C566A; font-size: 16px;")
+        self.change_indicator.setStyleSheet(self._CHANGE_IDLE_STYLE)
         self.change_indicator.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.change_indicator)
 
         layout.addStretch()
+        group.setLayout(layout)
         return group
 
     def create_chart_widget(self):
@@ -289,6 +479,7 @@ class SimpleEncoderGUI(QMainWindow):
         info_label.setStyleSheet("color: #4C566A; font-size: 12px;")
         layout.addWidget(info_label)
 
+        group.setLayout(layout)
         return group
 
     def create_control_widget(self):
@@ -298,19 +489,7 @@ class SimpleEncoderGUI(QMainWindow):
 
         # 开始/停止按钮
         self.start_btn = QPushButton("开始监控")
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #5E81AC;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #81A1C1;
-            }
-        """)
+        self.start_btn.setStyleSheet(self._START_BUTTON_STYLE)
         self.start_btn.clicked.connect(self.toggle_monitoring)
         layout.addWidget(self.start_btn)
 
@@ -338,6 +517,7 @@ class SimpleEncoderGUI(QMainWindow):
         layout.addLayout(threshold_layout)
 
         layout.addStretch()
+        group.setLayout(layout)
         return group
 
     def create_stats_widget(self):
@@ -375,6 +555,7 @@ class SimpleEncoderGUI(QMainWindow):
 
         # 添加垂直拉伸
         layout.setRowStretch(5, 1)
+        group.setLayout(layout)
         return group
 
     def create_log_widget(self):
@@ -382,11 +563,13 @@ class SimpleEncoderGUI(QMainWindow):
         group = QGroupBox("日志信息")
         layout = QVBoxLayout()
 
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setMaximumHeight(120)
         self.log_text.setReadOnly(True)
+        # 限制日志行数，超出后由 Qt 自动删除最早的行，避免长时间运行后文档无限增长
+        self.log_text.setMaximumBlockCount(self._log_max_blocks)
         self.log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #3B4252;
                 color: #D8DEE9;
                 font-family: 'Courier New', monospace;
@@ -396,6 +579,7 @@ class SimpleEncoderGUI(QMainWindow):
         """)
         layout.addWidget(self.log_text)
 
+        group.setLayout(layout)
         return group
 
     def toggle_monitoring(self):
@@ -414,22 +598,13 @@ class SimpleEncoderGUI(QMainWindow):
             self.data_reader.start()
 
             self.start_btn.setText("停止监控")
-            self.start_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #BF616A;
-                    color: white;
-                    font-size: 14px;
-                    font-weight: bold;
-                    padding: 10px;
-                    border-radius: 5px;
-                }
-            """)
+            self.start_btn.setStyleSheet(self._STOP_BUTTON_STYLE)
 
             self.start_time = datetime.now()
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] 开始监控...")
+            self.log_text.appendPlainText(f"[{self._format_time()}] 开始监控...")
 
         except Exception as e:
-            self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] 启动失败: {e}")
+            self.log_text.appendPlainText(f"[{self._format_time()}] 启动失败: {e}")
 
     def stop_monitoring(self):
         """停止监控"""
@@ -438,18 +613,9 @@ class SimpleEncoderGUI(QMainWindow):
             self.data_reader = None
 
         self.start_btn.setText("开始监控")
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #5E81AC;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px;
-                border-radius: 5px;
-            }
-        """)
+        self.start_btn.setStyleSheet(self._START_BUTTON_STYLE)
 
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] 监控已停止")
+        self.log_text.appendPlainText(f"[{self._format_time()}] 监控已停止")
 
     def on_data_received(self, position, timestamp):
         """接收数据"""
@@ -459,8 +625,7 @@ class SimpleEncoderGUI(QMainWindow):
 
         # 添加到历史数据
         self.position_history.append(position)
-        if len(self.position_history) > 500:
-            self.position_history.pop(0)
+        self._history_minmax.add(position)
 
         # 更新图表
         self.plot_widget.add_data_point(position)
@@ -469,34 +634,45 @@ class SimpleEncoderGUI(QMainWindow):
         if abs(position - self.last_position) >= self.threshold_spinbox.value():
             self.change_count += 1
             self.change_indicator.setText(f"● 发生变化 ({self.change_count} 次)")
-            self.change_indicator.setStyleSheet("color: #A3BE8C; font-size: 16px;")
+            if not self._change_active:
+                self.change_indicator.setStyleSheet(self._CHANGE_ACTIVE_STYLE)
+                self._change_active = True
 
             # 记录到日志
-            self.log_text.append(
-                f"[{timestamp.strftime('%H:%M:%S')}] 位置变化: {self.last_position:.3f} → {position:.3f} mm"
+            self.log_text.appendPlainText(
+                f"[{self._format_time(timestamp)}] 位置变化: {self.last_position:.3f} → {position:.3f} mm"
             )
 
             self.last_position = position
 
-            # 3秒后恢复指示器
-            QTimer.singleShot(3000, lambda: self.change_indicator.setStyleSheet("color: #4C566A; font-size: 16px;"))
+            # 3秒后恢复指示器（重新启动会先停止上一次的计时）
+            self._reset_timer.start(3000)
+
+    def _reset_change_indicator(self):
+        """恢复变化指示器颜色"""
+        self.change_indicator.setStyleSheet(self._CHANGE_IDLE_STYLE)
+        self._change_active = False
 
     def on_status_update(self, connected, message):
         """状态更新"""
         if connected:
             self.status_label.setText(f"✅ {message}")
-            self.status_label.setStyleSheet("color: #A3BE8C; font-size: 14px; font-weight: bold;")
         else:
             self.status_label.setText(f"❌ {message}")
-            self.status_label.setStyleSheet("color: #BF616A; font-size: 14px; font-weight: bold;")
+
+        # 样式只在连接状态切换时更新，避免重复解析样式表
+        if connected != self._status_connected:
+            self.status_label.setStyleSheet(
+                self._STATUS_OK_STYLE if connected else self._STATUS_FAIL_STYLE
+            )
+            self._status_connected = connected
 
     def update_display(self):
         """更新显示"""
         # 更新统计信息
-        if self.position_history:
-            max_val = max(self.position_history)
-            min_val = min(self.position_history)
-            avg_val = sum(self.position_history) / len(self.position_history)
+        if len(self.position_history):
+            max_val = self._history_minmax.max
+            min_val = self._history_minmax.min
 
             self.max_label.setText(f"{max_val:.3f} mm")
             self.min_label.setText(f"{min_val:.3f} mm")
@@ -504,18 +680,17 @@ class SimpleEncoderGUI(QMainWindow):
 
         # 更新运行时间
         if self.start_time:
-            runtime = datetime.now() - self.start_time
-            hours, remainder = divmod(runtime.seconds, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            self.runtime_label.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+            secs = int((datetime.now() - self.start_time).total_seconds())
+            self.runtime_label.setText(f"{secs // 3600:02d}:{secs // 60 % 60:02d}:{secs % 60:02d}")
 
     def clear_data(self):
         """清除数据"""
         self.position_history.clear()
+        self._history_minmax.clear()
         self.plot_widget.clear_data()
         self.change_count = 0
         self.change_indicator.setText("● 无变化")
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] 数据已清除")
+        self.log_text.appendPlainText(f"[{self._format_time()}] 数据已清除")
 
     def closeEvent(self, event):
         """关闭事件"""
@@ -21,6 +21,7 @@ def check_snap7_attributes():
 
     # 获取所有属性和方法
     all_attrs = dir(client)
+    attr_set = set(all_attrs)  # 用集合做成员判断，避免 hasattr 反复查找 MRO
 
     # 筛选可能的连接状态属性
     connection_attrs = [attr for attr in all_attrs if 'connect' in attr.lower()]
@@ -40,7 +41,7 @@ def check_snap7_attributes():
 
     print("\n检查连接状态相关属性：")
     for attr in test_attrs:
-        if hasattr(client, attr):
+        if attr in attr_set:
             value = getattr(client, attr)
             print(f"  ✅ {attr} = {value}")
         else:
@@ -57,7 +58,7 @@ def check_snap7_attributes():
         # 再次检查连接状态
         print("\n连接后的状态检查：")
         for attr in test_attrs:
-            if hasattr(client, attr):
+            if attr in attr_set:
                 try:
                     value = getattr(client, attr)
                     print(f"  ✅ {attr} = {value} (类型: {type(value)})")
@@ -68,13 +69,12 @@ def check_snap7_attributes():
         status_methods = ['get_connected', 'is_connected', 'check_connection', 'ConnectionTime']
         print("\n检查连接状态方法：")
         for method in status_methods:
-            if hasattr(client, method):
+            if method in attr_set:
                 try:
-                    if callable(getattr(client, method)):
-                        result = getattr(client, method)()
-                        print(f"  ✅ {method}() = {result}")
+                    value = getattr(client, method)
+                    if callable(value):
+                        print(f"  ✅ {method}() = {value()}")
                     else:
-                        value = getattr(client, method)
                         print(f"  ✅ {method} = {value}")
                 except Exception as e:
                     print(f"  ❌ {method} 调用失败: {e}")
@@ -84,57 +84,52 @@ def test_plc_connect():
         except:
             pass
 
-def test_network_ping():
-    """测试网络连通性"""
+def test_network_ping(retries=3, timeout=0.5, retry_interval=0.05):
+    """测试网络连通性（TCP 连接 S7 端口 102，不再调用外部 ping）"""
     import socket
+    import errno
 
     print("\n" + "-" * 50)
     print("网络连通性测试")
     print("-" * 50)
 
-    # 测试 ping
-    try:
-        # 尝试连接 S7 端口 (102)
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(5)
-
-        result = sock.connect_ex(('192.168.0.1', 102))
-
-        if result == 0:
-            print("✅ 网络连接正常 (端口 102 可达)")
-            return True
-        else:
-            print(f"❌ 网络连接失败 (端口 102 不可达)")
-            print(f"   错误代码: {result}")
+    # 对方主动拒绝连接，说明主机可达但端口未开放
+    refused_codes = {errno.ECONNREFUSED, getattr(errno, 'WSAECONNREFUSED', errno.ECONNREFUSED)}
 
-            # 尝试 ping 测试
-            print("\n尝试 ping 测试...")
+    try:
+        result = None
+        for attempt in range(retries):
+            if attempt:
+                time.sleep(retry_interval)
+
+            # 尝试连接 S7 端口 (102)
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
             try:
-                import subprocess
-                ping_result = subprocess.run(
-                    ['ping', '-n', '1', '192.168.0.1'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if ping_result.returncode == 0:
-                    print("✅ Ping 成功")
-                    print("   问题可能是：PLC 未启用 S7 服务或端口被阻止")
-                else:
-                    print("❌ Ping 失败")
-                    print("   问题可能是：IP 地址错误或网络不通")
-            except:
-                print("无法执行 ping 测试")
+                result = sock.connect_ex(('192.168.0.1', 102))
+            finally:
+                sock.close()
 
-            return False
+            if result == 0:
+                print("✅ 网络连接正常 (端口 102 可达)")
+                return True
+            if result in refused_codes:
+                break
+
+        print(f"❌ 网络连接失败 (端口 102 不可达)")
+        print(f"   错误代码: {result}")
+        if result in refused_codes:
+            print("   主机有响应但拒绝连接")
+            print("   问题可能是：PLC 未启用 S7 服务或端口被阻止")
+        else:
+            print(f"   {retries} 次尝试均无响应")
+            print("   问题可能是：IP 地址错误或网络不通")
+        return False
 
     except Exception as e:
         print(f"网络测试异常: {e}")
         return False
 
-    finally:
-        sock.close()
-
 if __name__ == "__main__":
     print(f"开始时间: {time.strftime('%Y-%m-%d %H:%M:%S')}")
 
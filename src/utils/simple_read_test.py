@@ -4,8 +4,11 @@
 简单读取测试 - 不检查连接状态，直接尝试读取
 """
 
+import struct
 import snap7
-from snap7.util import get_real
+
+# REAL (大端 IEEE-754 单精度) 解包函数，模块加载时编译一次
+_REAL_UNPACK = struct.Struct('>f').unpack_from
 
 def simple_read_test():
     """简单读取测试"""
@@ -32,7 +35,7 @@ def simple_read_test():
         print(f"原始数据: {data.hex()}")
 
         # 转换为 Real 值
-        position = get_real(data, 0)
+        position = _REAL_UNPACK(data, 0)[0]
         print(f"🎯 右缸编码器位置: {position:.3f} mm")
 
         return position
@@ -4,9 +4,13 @@
 连接测试脚本 - 用于调试 PLC 连接问题
 """
 
+import struct
 import snap7
 from datetime import datetime
 
+# REAL (大端 IEEE-754 单精度) 解包函数，模块加载时编译一次
+_REAL_UNPACK = struct.Struct('>f').unpack_from
+
 def test_plc_connection(ip_address="192.168.0.1", rack=0, slot=1):
     """测试 PLC 连接"""
 
@@ -93,8 +97,7 @@ def test_plc_connection(ip_address="192.168.0.1", rack=0, slot=1):
             print(f"   DB5.DBD124 (右缸编码器): {encoder_data.hex()}")
 
             # 转换为 Real 值
-            from snap7.util import get_real
-            position = get_real(encoder_data, 0)
+            position = _REAL_UNPACK(encoder_data, 0)[0]
             print(f"   转换后位置值: {position:.3f} mm")
 
         except Exception as e: